@@ -0,0 +1,58 @@
+import pygame
+import hashlib
+import os
+from config import *
+
+class AssetManager:
+    def __init__(self, cache_dir=ASSET_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.surfaces = {}
+
+    def cache_path(self, path, size):
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{name}_{digest}_{size[0]}x{size[1]}.png")
+
+    def image(self, path, size):
+        key = ('image', path, size)
+        if key in self.surfaces:
+            return self.surfaces[key]
+
+        try:
+            cache_path = self.cache_path(path, size)
+            if os.path.exists(cache_path):
+                surface = pygame.image.load(cache_path)
+            else:
+                surface = pygame.transform.scale(pygame.image.load(path), size)
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    pygame.image.save(surface, cache_path)
+                except (pygame.error, OSError) as e:
+                    print(f"Failed to cache asset {path}: {e}")
+            surface = surface.convert_alpha()
+        except (pygame.error, OSError) as e:
+            print(f"Failed to load asset {path}: {e}")
+            surface = None
+
+        self.surfaces[key] = surface
+        return surface
+
+    def gradient(self, size, start, end, vertical=True):
+        key = ('gradient', size, start, end, vertical)
+        if key in self.surfaces:
+            return self.surfaces[key]
+
+        width, height = size
+        surface = pygame.Surface(size).convert()
+        steps = height if vertical else width
+        for i in range(steps):
+            ratio = i / steps
+            color = tuple(int(start[c] * (1 - ratio) + end[c] * ratio) for c in range(3))
+            if vertical:
+                pygame.draw.line(surface, color, (0, i), (width, i))
+            else:
+                pygame.draw.line(surface, color, (i, 0), (i, height))
+
+        self.surfaces[key] = surface
+        return surface
@@ -0,0 +1,52 @@
+import argparse
+from config import *
+from camera import CAPTURE_BACKENDS, candidate_modes, measure_mode, save_camera_profile
+
+def parse_source(value):
+    return int(value) if value.isdigit() else value
+
+def describe(mode):
+    return f"{mode.fourcc} {mode.fps}fps" if mode.fourcc else "file"
+
+def main():
+    parser = argparse.ArgumentParser(description='Camera capture mode benchmark')
+    parser.add_argument('sources', nargs='*', default=['0'],
+                        help='Camera indexes, device paths or video files (default: 0)')
+    parser.add_argument('--backends', nargs='+', default=None, choices=list(CAPTURE_BACKENDS),
+                        help='Capture backends to try (default: platform dependent)')
+    parser.add_argument('--frames', type=int, default=120, help='Frames to read per mode (default: 120)')
+    parser.add_argument('--save', action='store_true',
+                        help=f'Save the best mode of each source to {CAMERA_PROFILE_FILE}')
+    args = parser.parse_args()
+
+    for source in map(parse_source, args.sources):
+        print(f"source {source}")
+        print(f"{'backend':<12}{'request':<14}{'actual':<22}{'fps':>8}{'read ms':>9}{'age ms':>8}")
+
+        results = []
+        for mode in candidate_modes(source, args.backends):
+            result = measure_mode(source, mode, args.frames)
+            request = describe(mode)
+            if result is None:
+                print(f"{mode.backend:<12}{request:<14}failed to open")
+                continue
+
+            actual = result['actual']
+            actual_text = f"{actual.fourcc} {actual.width}x{actual.height} {actual.fps:.0f}fps"
+            age = f"{result['age_ms']:.1f}" if result['age_ms'] is not None else "-"
+            print(f"{mode.backend:<12}{request:<14}{actual_text:<22}{result['fps']:>8.1f}"
+                  f"{result['read_ms']:>9.1f}{age:>8}")
+            results.append(result)
+
+        if not results:
+            print("no working capture mode")
+            continue
+
+        best = max(results, key=lambda r: (round(r['fps']), -(r['age_ms'] or r['read_ms'])))
+        print(f"best: {best['mode'].backend} {describe(best['mode'])}")
+        if args.save:
+            save_camera_profile(source, best['mode'])
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import cv2
+import argparse
+import time
+from config import *
+from pose_backend import POSE_BACKENDS, create_pose_backend
+
+def read_frames(path, max_frames):
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while cap.isOpened() and len(frames) < max_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frame = cv2.resize(cv2.flip(frame, 1), (CAMERA_WIDTH, CAMERA_HEIGHT))
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    cap.release()
+    return frames
+
+def shoulder_center_y(result):
+    if result is None:
+        return None
+    return (result.left_shoulder[1] + result.right_shoulder[1]) / 2
+
+def run_backend(backend, frames):
+    latencies = []
+    centers = []
+    for frame in frames:
+        start = time.perf_counter()
+        result = backend.process(frame)
+        latencies.append((time.perf_counter() - start) * 1000)
+        centers.append(shoulder_center_y(result))
+    return latencies, centers
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+def report(name, latencies, detected, total, errors):
+    mean_ms = sum(latencies) / len(latencies)
+    error = f"{sum(errors) / len(errors):.1f}" if errors else "-"
+    print(f"{name:<16}{mean_ms:>9.1f}{percentile(latencies, 0.95):>9.1f}"
+          f"{1000 / mean_ms:>8.1f}{detected / total:>8.0%}{error:>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Pose backend latency and accuracy benchmark')
+    parser.add_argument('videos', nargs='+', help='Recorded video files')
+    parser.add_argument('--backends', nargs='+', default=list(POSE_BACKENDS), choices=list(POSE_BACKENDS),
+                        help='Backends to benchmark (default: all)')
+    parser.add_argument('--reference', default='mediapipe-heavy', choices=list(POSE_BACKENDS),
+                        help='Backend used as ground truth for accuracy (default: mediapipe-heavy)')
+    parser.add_argument('--model', default=None, help=f'Model file for opencv-dnn (default: {POSE_MODEL_PATH})')
+    parser.add_argument('--frames', type=int, default=300, help='Max frames per video (default: 300)')
+    parser.add_argument('--warmup', type=int, default=5, help='Frames to skip before timing (default: 5)')
+    args = parser.parse_args()
+
+    backends = [args.reference] + [name for name in args.backends if name != args.reference]
+    results = {name: {'latencies': [], 'detected': 0, 'total': 0, 'errors': []} for name in backends}
+    unavailable = {}
+
+    for path in args.videos:
+        frames = read_frames(path, args.frames)
+        if len(frames) <= args.warmup:
+            print(f"Skipping {path}: not enough readable frames")
+            continue
+
+        reference_centers = []
+        for name in backends:
+            if name in unavailable:
+                continue
+            try:
+                backend = create_pose_backend(name, args.model)
+            except Exception as e:
+                unavailable[name] = e
+                continue
+
+            run_backend(backend, frames[:args.warmup])
+            timed, centers = run_backend(backend, frames[args.warmup:])
+            backend.close()
+
+            result = results[name]
+            result['latencies'].extend(timed)
+            result['total'] += len(centers)
+            result['detected'] += sum(1 for center in centers if center is not None)
+
+            if name == args.reference:
+                reference_centers = centers
+            for center, reference in zip(centers, reference_centers):
+                if center is not None and reference is not None:
+                    result['errors'].append(abs(center - reference) * GAME_HEIGHT)
+        del frames
+
+    print(f"{'backend':<16}{'mean ms':>9}{'p95 ms':>9}{'fps':>8}{'detect':>8}{'error px':>10}")
+    for name in backends:
+        result = results[name]
+        if name in unavailable:
+            print(f"{name:<16}unavailable: {unavailable[name]}")
+        elif not result['total']:
+            print(f"{name:<16}no readable frames")
+        else:
+            report(name, result['latencies'], result['detected'], result['total'], result['errors'])
+
+if __name__ == "__main__":
+    main()
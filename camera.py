@@ -0,0 +1,176 @@
+import cv2
+import json
+import sys
+import time
+from collections import namedtuple
+from config import *
+
+CaptureMode = namedtuple('CaptureMode', ['backend', 'fourcc', 'width', 'height', 'fps'])
+
+CAPTURE_BACKENDS = {
+    'any': cv2.CAP_ANY,
+    'v4l2': cv2.CAP_V4L2,
+    'gstreamer': cv2.CAP_GSTREAMER,
+    'ffmpeg': cv2.CAP_FFMPEG,
+    'dshow': cv2.CAP_DSHOW,
+    'msmf': cv2.CAP_MSMF,
+    'avfoundation': cv2.CAP_AVFOUNDATION,
+}
+
+def default_backends(source):
+    if isinstance(source, str):
+        return ['ffmpeg', 'gstreamer', 'any']
+    if sys.platform.startswith('win'):
+        return ['dshow', 'msmf', 'any']
+    if sys.platform == 'darwin':
+        return ['avfoundation', 'any']
+    return ['v4l2', 'gstreamer', 'any']
+
+def candidate_modes(source, backends=None):
+    if isinstance(source, str):
+        return [CaptureMode(backend, "", CAMERA_WIDTH, CAMERA_HEIGHT, 0)
+                for backend in backends or default_backends(source)]
+
+    modes = []
+    for backend in backends or default_backends(source):
+        for fourcc in CAMERA_FOURCCS:
+            for fps in CAMERA_FPS_OPTIONS:
+                modes.append(CaptureMode(backend, fourcc, CAMERA_WIDTH, CAMERA_HEIGHT, fps))
+    return modes
+
+def decode_fourcc(value):
+    value = int(value)
+    return "".join(chr((value >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00")
+
+def actual_mode(cap, mode):
+    return CaptureMode(
+        mode.backend,
+        decode_fourcc(cap.get(cv2.CAP_PROP_FOURCC)),
+        int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        cap.get(cv2.CAP_PROP_FPS)
+    )
+
+def open_capture(source, mode):
+    try:
+        cap = cv2.VideoCapture(source, CAPTURE_BACKENDS[mode.backend])
+    except cv2.error:
+        return None
+    if not cap.isOpened():
+        cap.release()
+        return None
+
+    if not isinstance(source, str):
+        if len(mode.fourcc) == 4:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*mode.fourcc))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, mode.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, mode.height)
+        if mode.fps:
+            cap.set(cv2.CAP_PROP_FPS, mode.fps)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, CAMERA_BUFFER_SIZE)
+
+    ret, _ = cap.read()
+    if not ret:
+        cap.release()
+        return None
+    return cap
+
+def mode_accepted(cap, mode):
+    actual = actual_mode(cap, mode)
+    return actual.fourcc == mode.fourcc and actual.fps >= mode.fps - 1
+
+def load_camera_profile(source):
+    try:
+        with open(CAMERA_PROFILE_FILE, 'r') as f:
+            return CaptureMode(**json.load(f)[str(source)])
+    except:
+        return None
+
+def save_camera_profile(source, mode):
+    try:
+        with open(CAMERA_PROFILE_FILE, 'r') as f:
+            profiles = json.load(f)
+    except:
+        profiles = {}
+
+    profiles[str(source)] = mode._asdict()
+
+    try:
+        with open(CAMERA_PROFILE_FILE, 'w') as f:
+            json.dump(profiles, f, indent=2)
+    except Exception as e:
+        print(f"Failed to save camera profile: {e}")
+
+def open_camera(source, preferred=None):
+    for mode in dict.fromkeys((preferred, load_camera_profile(source))):
+        if mode:
+            cap = open_capture(source, mode)
+            if cap:
+                return cap, actual_mode(cap, mode)
+
+    fallback = None
+    for mode in candidate_modes(source):
+        cap = open_capture(source, mode)
+        if cap is None:
+            continue
+        if mode_accepted(cap, mode):
+            return cap, actual_mode(cap, mode)
+        cap.release()
+        if fallback is None:
+            fallback = mode
+
+    if fallback:
+        cap = open_capture(source, fallback)
+        if cap:
+            return cap, actual_mode(cap, fallback)
+    return None, None
+
+def frame_age(cap, source, start):
+    position = cap.get(cv2.CAP_PROP_POS_MSEC)
+    if isinstance(source, str):
+        now = (time.perf_counter() - start) * 1000
+        if now < position:
+            time.sleep((position - now) / 1000)
+            return 0
+        return now - position
+
+    age = time.monotonic() * 1000 - position
+    return age if 0 <= age < 10000 else None
+
+def measure_mode(source, mode, frames=120, warmup=10):
+    cap = open_capture(source, mode)
+    if cap is None:
+        return None
+
+    for _ in range(warmup):
+        cap.read()
+
+    read_times = []
+    ages = []
+    start = time.perf_counter()
+    if isinstance(source, str):
+        start -= cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+    measure_start = time.perf_counter()
+    for _ in range(frames):
+        read_start = time.perf_counter()
+        ret, _ = cap.read()
+        if not ret:
+            break
+        read_times.append((time.perf_counter() - read_start) * 1000)
+        age = frame_age(cap, source, start)
+        if age is not None:
+            ages.append(age)
+    elapsed = time.perf_counter() - measure_start
+
+    actual = actual_mode(cap, mode)
+    cap.release()
+    if not read_times:
+        return None
+
+    return {
+        'mode': mode,
+        'actual': actual,
+        'fps': len(read_times) / elapsed,
+        'read_ms': sum(read_times) / len(read_times),
+        'age_ms': sum(ages) / len(ages) if ages else None,
+    }
@@ -59,3 +59,46 @@ PLAYING = 1
 GAME_OVER = 2
 
 MAX_ID_LENGTH = 5
+
+TARGET_FPS = 60
+
+GOVERNOR_WINDOW = 30
+GOVERNOR_DEGRADE_RATIO = 0.9
+GOVERNOR_RECOVER_RATIO = 0.6
+GOVERNOR_RECOVER_FRAMES = 180
+GOVERNOR_PREVIEW_INTERVAL = 3
+
+HIGHLIGHT_DIR = "highlights"
+RECORD_SECONDS = 6
+RECORD_FPS = 12
+RECORD_SCALE = 0.4
+RECORD_FOURCC = "mp4v"
+RECORD_EXTENSION = "mp4"
+
+POSE_BACKEND = "mediapipe"
+POSE_MODEL_PATH = os.path.join("models", "pose.onnx")
+POSE_DNN_INPUT_SIZE = (256, 256)
+POSE_DNN_SHOULDER_CHANNELS = (5, 2)
+POSE_DNN_THRESHOLD = 0.1
+POSE_DNN_CHANNEL_ORDER = "BGR"
+POSE_DNN_SCALE = 1.0 / 255
+POSE_DNN_MEAN = (0, 0, 0)
+
+ASSET_CACHE_DIR = ".asset_cache"
+
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9108
+METRICS_FILE = None
+METRICS_INTERVAL = 15
+METRICS_WINDOW = 600
+
+CAMERA_FOURCCS = ("MJPG", "YUYV")
+CAMERA_FPS_OPTIONS = (60, 30)
+CAMERA_BUFFER_SIZE = 1
+CAMERA_PROFILE_FILE = "camera_profile.json"
+
+IDLE_FPS = 15
+IDLE_ANIMATION_FPS = 30
+IDLE_PULSE_FRAMES = 48
+
+PLAY_FULL_REDRAW_RATIO = 0.5
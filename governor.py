@@ -0,0 +1,37 @@
+from collections import deque
+from config import *
+
+class FrameGovernor:
+    FEATURES = ['particles', 'pipe_details', 'camera_preview', 'landmarks']
+
+    def __init__(self, target_fps=TARGET_FPS):
+        self.budget = 1000 / target_fps
+        self.degrade_limit = self.budget * GOVERNOR_DEGRADE_RATIO
+        self.recover_limit = self.budget * GOVERNOR_RECOVER_RATIO
+
+        self.frame_times = deque(maxlen=GOVERNOR_WINDOW)
+        self.level = 0
+        self.frames_since_change = 0
+
+    def record(self, frame_ms):
+        self.frame_times.append(frame_ms)
+        self.frames_since_change += 1
+
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+
+        average = sum(self.frame_times) / len(self.frame_times)
+
+        if average > self.degrade_limit and self.level < len(self.FEATURES):
+            self.set_level(self.level + 1)
+        elif (average < self.recover_limit and self.level > 0 and
+              self.frames_since_change >= GOVERNOR_RECOVER_FRAMES):
+            self.set_level(self.level - 1)
+
+    def set_level(self, level):
+        self.level = level
+        self.frame_times.clear()
+        self.frames_since_change = 0
+
+    def enabled(self, feature):
+        return self.FEATURES.index(feature) >= self.level
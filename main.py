@@ -4,20 +4,34 @@ import json
 import sys
 import argparse
 import math
+import os
 import random
+import time
 from datetime import datetime
 from config import *
 from player import Player
 from pipe import Pipe
+from governor import FrameGovernor
+from assets import AssetManager
+from recorder import SessionRecorder
+from pose_backend import POSE_BACKENDS, create_pose_backend
+from metrics import Metrics, MetricsExporter
 
 class Game:
-    def __init__(self, camera_index=0):
+    def __init__(self, camera_index=0, pose_backend=POSE_BACKEND, pose_model=None,
+                 metrics_port=METRICS_PORT, metrics_file=METRICS_FILE):
         pygame.init()
         
         self.screen = pygame.display.set_mode((GAME_WIDTH, GAME_HEIGHT))
         pygame.display.set_caption("Chin-up Flappy Bird")
         self.clock = pygame.time.Clock()
         
+        self.assets = AssetManager()
+        self.background = self.assets.gradient((GAME_WIDTH, GAME_HEIGHT), GRADIENT_START, GRADIENT_END)
+        self.pipe_body = self.assets.gradient((PIPE_WIDTH, GAME_HEIGHT), PIPE_GREEN, PIPE_HIGHLIGHT, vertical=False)
+        self.ranking_panel = self.assets.gradient((280, 400), (20, 20, 60), (50, 50, 100))
+        self.gameover_background = self.assets.gradient((GAME_WIDTH, GAME_HEIGHT), (50, 0, 0), (150, 0, 0))
+        
         try:
             self.font_large = pygame.font.Font(None, FONT_SIZE_LARGE)
             self.font_medium = pygame.font.Font(None, FONT_SIZE_MEDIUM)
@@ -27,10 +41,40 @@ class Game:
             self.font_medium = pygame.font.SysFont('Arial', FONT_SIZE_MEDIUM, bold=True)
             self.font_small = pygame.font.SysFont('Arial', FONT_SIZE_SMALL)
         
+        self.lobby_pulse = self.pulse_frames(
+            "PRESS ENTER TO START!", 
+            LIME_GREEN, 
+            FONT_SIZE_MEDIUM, 
+            [1.0 + 0.1 * abs(math.sin(math.pi * i / IDLE_PULSE_FRAMES)) for i in range(IDLE_PULSE_FRAMES)]
+        )
+        self.gameover_pulse = self.pulse_frames(
+            "GAME OVER", 
+            RED, 
+            FONT_SIZE_LARGE, 
+            [1.0 + 0.2 * math.sin(2 * math.pi * i / IDLE_PULSE_FRAMES) for i in range(IDLE_PULSE_FRAMES)]
+        )
+        self.border_colors = [
+            tuple(int(128 + 127 * math.sin(2 * math.pi * i / IDLE_PULSE_FRAMES + c)) for c in range(3))
+            for i in range(IDLE_PULSE_FRAMES)
+        ]
+        self.gameover_controls = [
+            (self.font_small.render("Press R to RESTART", True, LIME_GREEN), (GAME_WIDTH // 2, 400)),
+            (self.font_small.render("Press ESC for LOBBY", True, ORANGE), (GAME_WIDTH // 2, 425))
+        ]
+        
         self.state = LOBBY
         self.running = True
         
-        self.player = Player(PLAYER_X, GAME_HEIGHT // 2)
+        self.metrics = Metrics()
+        self.metrics_exporter = MetricsExporter(self.metrics, metrics_port, metrics_file)
+        
+        self.player = Player(
+            PLAYER_X, 
+            GAME_HEIGHT // 2, 
+            create_pose_backend(pose_backend, pose_model), 
+            self.assets.image(BIRD_IMAGE, (PLAYER_SIZE, PLAYER_SIZE)), 
+            self.metrics
+        )
         self.camera_index = camera_index
         
         self.pipes = []
@@ -52,6 +96,30 @@ class Game:
         self.background_offset = 0
         self.score_saved = False
         
+        self.governor = FrameGovernor()
+        self.camera_frame_count = 0
+        
+        self.recorder = SessionRecorder()
+        self.camera_frame = None
+        
+        self.drawn_state = None
+        self.ticked_state = None
+        self.idle_base = None
+        self.idle_background = None
+        self.idle_key = None
+        self.idle_animating = False
+        self.pulse_surface = None
+        self.pulse_rect = None
+        self.border_color = None
+        self.lobby_input_area = pygame.Rect(GAME_WIDTH // 2 - 300, 320, 600, 110)
+        
+        self.play_rects = None
+        self.hud_cache = {}
+        self.instruction_bar = pygame.Surface((GAME_WIDTH, 60)).convert()
+        self.instruction_bar.fill(BLACK)
+        instruction = self.font_medium.render("Use chin-ups to control the bird! Press ESC to quit", True, WHITE)
+        self.instruction_bar.blit(instruction, instruction.get_rect(center=(GAME_WIDTH // 2, 30)))
+        
     def load_rankings(self):
         try:
             with open(RANKING_FILE, 'r') as f:
@@ -60,22 +128,59 @@ class Game:
         except:
             return []
     
-    def save_ranking(self, user_id, score):
+    def save_ranking(self, user_id, score, clip=None):
         new_entry = {
             'id': user_id,
             'score': score,
             'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
+        if clip:
+            new_entry['clip'] = clip
         
         self.rankings.append(new_entry)
         
-        self.rankings = sorted(self.rankings, key=lambda x: x['score'], reverse=True)[:10]
+        rankings = sorted(self.rankings, key=lambda x: x['score'], reverse=True)
+        self.rankings = rankings[:10]
         
+        for dropped in rankings[10:]:
+            if dropped.get('clip'):
+                try:
+                    os.remove(dropped['clip'])
+                except OSError:
+                    pass
+        
+        self.write_rankings()
+    
+    def write_rankings(self):
+        start = time.perf_counter()
         try:
             with open(RANKING_FILE, 'w') as f:
                 json.dump(self.rankings, f, indent=2)
         except Exception as e:
             print(f"Failed to save rankings: {e}")
+        self.metrics.record_ranking_save(time.perf_counter() - start)
+    
+    def discard_failed_clips(self):
+        failed = set()
+        while self.recorder.failed:
+            failed.add(self.recorder.failed.popleft())
+        
+        for ranking in self.rankings:
+            if ranking.get('clip') in failed:
+                del ranking['clip']
+        self.write_rankings()
+    
+    def is_ranking_score(self, score):
+        return len(self.rankings) < 10 or score > self.rankings[9]['score']
+    
+    def save_highlight(self):
+        if not self.is_ranking_score(self.score):
+            self.recorder.clear()
+            return None
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = os.path.join(HIGHLIGHT_DIR, f"{self.user_id}_{timestamp}.{RECORD_EXTENSION}")
+        return self.recorder.save(path)
     
     def reset_game(self):
         self.pipes = []
@@ -85,11 +190,13 @@ class Game:
         self.player.velocity = 0
         self.last_pipe_time = pygame.time.get_ticks()
         self.score_saved = False
+        self.recorder.clear()
+        self.camera_frame = None
     
     def spawn_pipe(self):
         current_time = pygame.time.get_ticks()
         if current_time - self.last_pipe_time > PIPE_SPAWN_TIME:
-            self.pipes.append(Pipe(GAME_WIDTH))
+            self.pipes.append(Pipe(GAME_WIDTH, self.pipe_body))
             self.last_pipe_time = current_time
     
     def update_pipes(self):
@@ -121,12 +228,7 @@ class Game:
         return False
     
     def draw_gradient_background(self):
-        for y in range(GAME_HEIGHT):
-            ratio = y / GAME_HEIGHT
-            r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
-            g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
-            b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (GAME_WIDTH, y))
+        self.screen.blit(self.background, (0, 0))
     
     def draw_clouds(self):
         cloud_positions = [
@@ -136,20 +238,25 @@ class Game:
             (700 + self.background_offset * 0.25, 100)
         ]
         
+        rects = []
         for x, y in cloud_positions:
             x = x % (GAME_WIDTH + 200) - 100
-            self.draw_cloud(x, y)
+            rects.append(self.draw_cloud(x, y))
+        return rects
     
     def draw_cloud(self, x, y):
-        cloud_color = (255, 255, 255, 180)
-        pygame.draw.circle(self.screen, WHITE, (int(x), int(y)), 30)
-        pygame.draw.circle(self.screen, WHITE, (int(x + 25), int(y - 10)), 25)
-        pygame.draw.circle(self.screen, WHITE, (int(x - 25), int(y - 5)), 20)
-        pygame.draw.circle(self.screen, WHITE, (int(x + 10), int(y + 15)), 18)
-        pygame.draw.circle(self.screen, WHITE, (int(x - 10), int(y + 10)), 22)
+        rect = pygame.draw.circle(self.screen, WHITE, (int(x), int(y)), 30)
+        return rect.unionall([
+            pygame.draw.circle(self.screen, WHITE, (int(x + 25), int(y - 10)), 25),
+            pygame.draw.circle(self.screen, WHITE, (int(x - 25), int(y - 5)), 20),
+            pygame.draw.circle(self.screen, WHITE, (int(x + 10), int(y + 15)), 18),
+            pygame.draw.circle(self.screen, WHITE, (int(x - 10), int(y + 10)), 22)
+        ])
     
     def create_particle_effect(self, x, y, color, count=5):
-        import random
+        if not self.governor.enabled('particles'):
+            return
+        
         for _ in range(count):
             particle = {
                 'x': x + random.randint(-10, 10),
@@ -172,11 +279,11 @@ class Game:
                 self.particles.remove(particle)
     
     def draw_particles(self):
+        rects = []
         for particle in self.particles:
-            alpha = int(255 * (particle['life'] / 30))
-            color = (*particle['color'][:3], alpha)
-            pygame.draw.circle(self.screen, particle['color'], 
-                             (int(particle['x']), int(particle['y'])), 3)
+            rects.append(pygame.draw.circle(self.screen, particle['color'], 
+                                            (int(particle['x']), int(particle['y'])), 3))
+        return rects
     
     def handle_lobby_input(self, event):
         if event.type == pygame.KEYDOWN:
@@ -197,6 +304,7 @@ class Game:
                 self.player.jump()
             elif event.key == pygame.K_ESCAPE:
                 self.state = LOBBY
+                self.recorder.clear()
                 self.player.cleanup()
                 cv2.destroyAllWindows()
     
@@ -212,14 +320,66 @@ class Game:
                 self.user_id = ""
                 cv2.destroyAllWindows()
     
+    def pulse_frames(self, text, color, size, scales):
+        renders = {}
+        frames = []
+        for scale in scales:
+            font_size = int(size * scale)
+            if font_size not in renders:
+                renders[font_size] = pygame.font.Font(None, font_size).render(text, True, color)
+            frames.append(renders[font_size])
+        return frames
+    
+    def draw_pulse(self, frames, phase, center):
+        surface = frames[int(phase * len(frames)) % len(frames)]
+        if surface is self.pulse_surface:
+            return None
+        
+        rect = surface.get_rect(center=center)
+        area = rect.union(self.pulse_rect) if self.pulse_rect else rect
+        self.screen.blit(self.idle_background, area, area)
+        self.screen.blit(surface, rect)
+        
+        self.pulse_surface = surface
+        self.pulse_rect = rect
+        return area
+    
     def draw_lobby(self):
+        dirty = []
+        
+        if self.idle_base is None:
+            self.draw_lobby_background()
+            self.idle_base = self.screen.copy()
+            self.idle_key = None
+            dirty = None
+        
+        if self.idle_key != self.user_id:
+            area = self.lobby_input_area.union(self.pulse_rect) if self.pulse_rect else self.lobby_input_area
+            self.screen.blit(self.idle_base, area, area)
+            self.draw_id_input()
+            self.idle_background = self.screen.copy()
+            self.idle_key = self.user_id
+            self.pulse_surface = None
+            self.pulse_rect = None
+            if dirty is not None:
+                dirty.append(area)
+        
+        self.idle_animating = len(self.user_id) == MAX_ID_LENGTH
+        if self.idle_animating:
+            phase = (pygame.time.get_ticks() * 0.005 / math.pi) % 1
+            rect = self.draw_pulse(self.lobby_pulse, phase, (GAME_WIDTH // 2, 400))
+            if rect and dirty is not None:
+                dirty.append(rect)
+        
+        return dirty
+    
+    def draw_lobby_background(self):
         self.draw_gradient_background()
         self.draw_clouds()
         
         title_text = "CHIN-UP FLAPPY BIRD"
         
         for offset in range(8, 0, -2):
-            glow_color = (255, 255, 255, 50)
             glow_surface = self.font_large.render(title_text, True, GOLD)
             glow_rect = glow_surface.get_rect(center=(GAME_WIDTH // 2 + offset//2, 120 + offset//2))
             self.screen.blit(glow_surface, glow_rect)
@@ -232,13 +392,15 @@ class Game:
         subtitle_rect = subtitle.get_rect(center=(GAME_WIDTH // 2, 180))
         self.screen.blit(subtitle, subtitle_rect)
         
-        input_y = 280
-        
         label_text = "ENTER YOUR ID (5 CHARACTERS):"
         label = self.font_medium.render(label_text, True, WHITE)
-        label_rect = label.get_rect(center=(GAME_WIDTH // 2, input_y))
+        label_rect = label.get_rect(center=(GAME_WIDTH // 2, 280))
         self.screen.blit(label, label_rect)
         
+        self.draw_fancy_rankings(GAME_WIDTH - 160, 250)
+    
+    def draw_id_input(self):
+        input_y = 280
         input_box = pygame.Rect(GAME_WIDTH // 2 - 150, input_y + 50, 300, 60)
         
         shadow_box = pygame.Rect(input_box.x + 3, input_box.y + 3, input_box.width, input_box.height)
@@ -264,89 +426,133 @@ class Game:
             char_text_rect = char_text.get_rect(center=char_rect.center)
             self.screen.blit(char_text, char_text_rect)
         
-        instruction_y = input_y + 120
-        
-        if len(self.user_id) == MAX_ID_LENGTH:
-            time_factor = pygame.time.get_ticks() * 0.005
-            pulse_scale = 1.0 + 0.1 * abs(math.sin(time_factor))
-            instruction_text = "PRESS ENTER TO START!"
-            instruction_color = LIME_GREEN
-            
-            scaled_font = pygame.font.Font(None, int(FONT_SIZE_MEDIUM * pulse_scale))
-            instruction = scaled_font.render(instruction_text, True, instruction_color)
-        else:
+        if len(self.user_id) < MAX_ID_LENGTH:
             remaining = MAX_ID_LENGTH - len(self.user_id)
             instruction_text = f"Enter {remaining} more character{'s' if remaining > 1 else ''}"
             instruction = self.font_small.render(instruction_text, True, WHITE)
-            
-        instruction_rect = instruction.get_rect(center=(GAME_WIDTH // 2, instruction_y))
-        self.screen.blit(instruction, instruction_rect)
-        
-        self.draw_fancy_rankings(GAME_WIDTH - 160, 250)
+            instruction_rect = instruction.get_rect(center=(GAME_WIDTH // 2, input_y + 120))
+            self.screen.blit(instruction, instruction_rect)
     
     def draw_game(self):
         self.background_offset -= self.current_speed * 0.5
-        
-        self.draw_gradient_background()
-        self.draw_clouds()
-        
         self.update_particles()
-        self.draw_particles()
-        
-        for pipe in self.pipes:
-            pipe.draw(self.screen)
-        
-        self.player.draw(self.screen)
-        
-        score_bg = pygame.Rect(20, 20, 300, 55)
-        pygame.draw.rect(self.screen, (0, 0, 0, 150), score_bg, border_radius=12)
-        pygame.draw.rect(self.screen, GOLD, score_bg, 4, border_radius=12)
         
-        score_text = self.font_large.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (30, 30))
+        full = self.play_rects is None or self.screen_shake > 0
+        if full:
+            self.draw_gradient_background()
+        else:
+            for rect in self.play_rects:
+                self.screen.blit(self.background, rect, rect)
         
-        speed_bg = pygame.Rect(20, 85, 250, 45)
-        pygame.draw.rect(self.screen, (0, 0, 0, 150), speed_bg, border_radius=10)
-        pygame.draw.rect(self.screen, ORANGE, speed_bg, 3, border_radius=10)
+        rects = self.draw_clouds()
+        rects += self.draw_particles()
         
-        speed_text = self.font_medium.render(f"Speed: {self.current_speed:.1f}", True, WHITE)
-        self.screen.blit(speed_text, (30, 95))
+        pipe_details = self.governor.enabled('pipe_details')
+        for pipe in self.pipes:
+            rects.append(pipe.draw(self.screen, pipe_details))
         
-        id_bg = pygame.Rect(20, 140, 280, 45)
-        pygame.draw.rect(self.screen, (0, 0, 0, 150), id_bg, border_radius=8)
-        pygame.draw.rect(self.screen, CYAN, id_bg, 3, border_radius=8)
+        rects += self.player.draw(self.screen)
         
-        id_text = self.font_medium.render(f"Player: {self.user_id}", True, WHITE)
-        self.screen.blit(id_text, (30, 150))
+        dirty = None if full else self.play_rects + rects
+        dirty_hud = self.draw_hud(dirty)
         
-        pose_bg = pygame.Rect(20, 190, 280, 45)
-        if self.player.pose_detected:
-            pygame.draw.rect(self.screen, (0, 100, 0, 150), pose_bg, border_radius=8)
-            pygame.draw.rect(self.screen, LIME_GREEN, pose_bg, 3, border_radius=8)
-            pose_text = self.font_medium.render("Pose: ACTIVE", True, LIME_GREEN)
+        instruction_rect = self.instruction_bar.get_rect(bottom=GAME_HEIGHT)
+        if full:
+            self.screen.blit(self.instruction_bar, instruction_rect)
         else:
-            pygame.draw.rect(self.screen, (100, 0, 0, 150), pose_bg, border_radius=8)
-            pygame.draw.rect(self.screen, RED, pose_bg, 3, border_radius=8)
-            pose_text = self.font_medium.render("Pose: LOST", True, RED)
+            for rect in dirty:
+                area = rect.clip(instruction_rect)
+                if area:
+                    self.screen.blit(self.instruction_bar, area, area.move(0, -instruction_rect.y))
+        
+        self.play_rects = rects
+        if full:
+            return None
+        
+        merged = []
+        for rect in dirty + dirty_hud:
+            for i, other in enumerate(merged):
+                if rect.colliderect(other):
+                    merged[i] = other.union(rect)
+                    break
+            else:
+                merged.append(rect)
         
-        self.screen.blit(pose_text, (30, 200))
+        if sum(rect.width * rect.height for rect in merged) > GAME_WIDTH * GAME_HEIGHT * PLAY_FULL_REDRAW_RATIO:
+            return None
+        return merged
+    
+    def draw_hud(self, dirty):
+        pose_active = self.player.pose_detected
+        panels = [
+            ('score', pygame.Rect(20, 20, 300, 55), 12, (0, 0, 0, 150), GOLD, 4, 
+             self.font_large, f"Score: {self.score}", WHITE),
+            ('speed', pygame.Rect(20, 85, 250, 45), 10, (0, 0, 0, 150), ORANGE, 3, 
+             self.font_medium, f"Speed: {self.current_speed:.1f}", WHITE),
+            ('id', pygame.Rect(20, 140, 280, 45), 8, (0, 0, 0, 150), CYAN, 3, 
+             self.font_medium, f"Player: {self.user_id}", WHITE),
+            ('pose', pygame.Rect(20, 190, 280, 45), 8, 
+             (0, 100, 0, 150) if pose_active else (100, 0, 0, 150), 
+             LIME_GREEN if pose_active else RED, 3, 
+             self.font_medium, "Pose: ACTIVE" if pose_active else "Pose: LOST", 
+             LIME_GREEN if pose_active else RED),
+        ]
         
-        instruction_bg = pygame.Rect(0, GAME_HEIGHT - 60, GAME_WIDTH, 60)
-        pygame.draw.rect(self.screen, (0, 0, 0, 180), instruction_bg)
+        changed = []
+        for name, rect, radius, fill, border, width, font, text, color in panels:
+            cached = self.hud_cache.get(name)
+            if cached is None or cached[0] != text:
+                surface = font.render(text, True, color)
+                area = rect.union(surface.get_rect(topleft=(rect.x + 10, rect.y + 10)))
+                if cached:
+                    area = area.union(cached[2])
+                cached = (text, surface, area)
+                self.hud_cache[name] = cached
+                changed.append(area)
+            elif dirty is not None and cached[2].collidelist(dirty) == -1:
+                continue
+            
+            pygame.draw.rect(self.screen, fill, rect, border_radius=radius)
+            pygame.draw.rect(self.screen, border, rect, width, border_radius=radius)
+            self.screen.blit(cached[1], (rect.x + 10, rect.y + 10))
         
-        instruction = self.font_medium.render("Use chin-ups to control the bird! Press ESC to quit", True, WHITE)
-        instruction_rect = instruction.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT - 30))
-        self.screen.blit(instruction, instruction_rect)
+        return changed
     
     def draw_gameover(self):
-        overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
-        overlay.set_alpha(200)
-        for y in range(GAME_HEIGHT):
-            darkness = int(50 + (y / GAME_HEIGHT) * 100)
-            pygame.draw.line(overlay, (darkness, 0, 0), (0, y), (GAME_WIDTH, y))
-        self.screen.blit(overlay, (0, 0))
+        dirty = []
+        
+        if self.idle_base is None:
+            self.draw_gameover_background()
+            self.idle_base = self.screen.copy()
+            self.idle_background = self.idle_base
+            self.pulse_surface = None
+            self.pulse_rect = None
+            self.border_color = None
+            dirty = None
+        
+        self.idle_animating = True
+        phase = (pygame.time.get_ticks() * 0.003 / (2 * math.pi)) % 1
+        
+        rect = self.draw_pulse(self.gameover_pulse, phase, (GAME_WIDTH // 2, 120))
+        if rect and dirty is not None:
+            dirty.append(rect)
+        
+        border_color = self.border_colors[int(phase * len(self.border_colors)) % len(self.border_colors)]
+        if border_color != self.border_color:
+            self.border_color = border_color
+            control_bg = pygame.Rect(GAME_WIDTH // 2 - 180, 380, 360, 60)
+            pygame.draw.rect(self.screen, (0, 0, 0, 150), control_bg, border_radius=15)
+            pygame.draw.rect(self.screen, border_color, control_bg, 3, border_radius=15)
+            
+            for text, center in self.gameover_controls:
+                self.screen.blit(text, text.get_rect(center=center))
+            if dirty is not None:
+                dirty.append(control_bg)
         
-        time_factor = pygame.time.get_ticks() * 0.003
+        return dirty
+    
+    def draw_gameover_background(self):
+        self.screen.blit(self.gameover_background, (0, 0))
         
         for offset in range(5, 0, -1):
             shadow_alpha = int(100 - offset * 15)
@@ -354,12 +560,6 @@ class Game:
             shadow_rect = game_over_shadow.get_rect(center=(GAME_WIDTH // 2 + offset, 120 + offset))
             self.screen.blit(game_over_shadow, shadow_rect)
         
-        pulse = 1.0 + 0.2 * math.sin(time_factor)
-        scaled_font = pygame.font.Font(None, int(FONT_SIZE_LARGE * pulse))
-        game_over = scaled_font.render("GAME OVER", True, RED)
-        game_over_rect = game_over.get_rect(center=(GAME_WIDTH // 2, 120))
-        self.screen.blit(game_over, game_over_rect)
-        
         panel_rect = pygame.Rect(GAME_WIDTH // 2 - 200, 180, 400, 200)
         pygame.draw.rect(self.screen, (0, 0, 0, 180), panel_rect, border_radius=20)
         pygame.draw.rect(self.screen, GOLD, panel_rect, 4, border_radius=20)
@@ -388,23 +588,6 @@ class Game:
         message_rect = message_surface.get_rect(center=(GAME_WIDTH // 2, 300))
         self.screen.blit(message_surface, message_rect)
         
-        controls_y = 400
-        control_bg = pygame.Rect(GAME_WIDTH // 2 - 180, controls_y - 20, 360, 60)
-        
-        border_color = [int(128 + 127 * math.sin(time_factor + i)) for i in range(3)]
-        pygame.draw.rect(self.screen, (0, 0, 0, 150), control_bg, border_radius=15)
-        pygame.draw.rect(self.screen, border_color, control_bg, 3, border_radius=15)
-        
-        restart_text = "Press R to RESTART"
-        restart = self.font_small.render(restart_text, True, LIME_GREEN)
-        restart_rect = restart.get_rect(center=(GAME_WIDTH // 2, controls_y))
-        self.screen.blit(restart, restart_rect)
-        
-        lobby_text = "Press ESC for LOBBY"
-        lobby = self.font_small.render(lobby_text, True, ORANGE)
-        lobby_rect = lobby.get_rect(center=(GAME_WIDTH // 2, controls_y + 25))
-        self.screen.blit(lobby, lobby_rect)
-        
         self.draw_fancy_rankings(GAME_WIDTH - 160, 150)
     
     def draw_fancy_rankings(self, x, y):
@@ -412,20 +595,12 @@ class Game:
         panel_height = 400
         panel_rect = pygame.Rect(x - panel_width//2, y, panel_width, panel_height)
         
-        for i in range(panel_height):
-            ratio = i / panel_height
-            r = int(20 * (1 - ratio) + 50 * ratio)
-            g = int(20 * (1 - ratio) + 50 * ratio)
-            b = int(60 * (1 - ratio) + 100 * ratio)
-            pygame.draw.line(self.screen, (r, g, b), 
-                           (panel_rect.left, panel_rect.top + i), 
-                           (panel_rect.right, panel_rect.top + i))
+        self.screen.blit(self.ranking_panel, panel_rect)
         
         pygame.draw.rect(self.screen, GOLD, panel_rect, 4, border_radius=15)
         
         title_text = "TOP SCORES"
-        title_font = pygame.font.Font(None, FONT_SIZE_MEDIUM)
-        title = title_font.render(title_text, True, GOLD)
+        title = self.font_medium.render(title_text, True, GOLD)
         title_rect = title.get_rect(center=(x, y + 30))
         self.screen.blit(title, title_rect)
         
@@ -449,26 +624,32 @@ class Game:
             pygame.draw.rect(self.screen, (0, 0, 0, 150), rank_bg, border_radius=8)
             pygame.draw.rect(self.screen, color, rank_bg, 3, border_radius=8)
             
-            medal_font = pygame.font.Font(None, FONT_SIZE_MEDIUM)
-            medal_text = medal_font.render(medal, True, color)
+            medal_text = self.font_medium.render(medal, True, color)
             self.screen.blit(medal_text, (x - 120, rank_y - 3))
             
             rank_text = f"{ranking['id']}: {ranking['score']}"
-            text_font = pygame.font.Font(None, FONT_SIZE_MEDIUM)
-            text = text_font.render(rank_text, True, WHITE)
+            text = self.font_medium.render(rank_text, True, WHITE)
             self.screen.blit(text, (x - 50, rank_y - 3))
         
         if not self.rankings:
-            no_data_font = pygame.font.Font(None, FONT_SIZE_MEDIUM)
-            no_data = no_data_font.render("No scores yet!", True, WHITE)
+            no_data = self.font_medium.render("No scores yet!", True, WHITE)
             no_data_rect = no_data.get_rect(center=(x, y + 150))
             self.screen.blit(no_data, no_data_rect)
     
     def update_camera(self):
         frame = self.player.update_pose()
-        if frame is not None:
+        self.camera_frame = frame
+        if frame is None:
+            return 0
+        
+        start = time.perf_counter()
+        self.player.draw_pose(frame, self.governor.enabled('landmarks'))
+        self.camera_frame_count += 1
+        if (self.governor.enabled('camera_preview') or
+                self.camera_frame_count % GOVERNOR_PREVIEW_INTERVAL == 0):
             cv2.imshow(self.cv_window_name, frame)
             cv2.moveWindow(self.cv_window_name, GAME_WIDTH + 50, 50)
+        return (time.perf_counter() - start) * 1000
     
     def run(self):
         while self.running:
@@ -476,6 +657,10 @@ class Game:
                 if event.type == pygame.QUIT:
                     self.running = False
                     
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    self.idle_base = None
+                    self.play_rects = None
+                    
                 elif self.state == LOBBY:
                     self.handle_lobby_input(event)
                     
@@ -485,8 +670,9 @@ class Game:
                 elif self.state == GAME_OVER:
                     self.handle_gameover_input(event)
             
+            render_ms = 0
             if self.state == PLAYING:
-                self.update_camera()
+                render_ms += self.update_camera()
                 self.player.update()
                 
                 self.spawn_pipe()
@@ -494,36 +680,81 @@ class Game:
                 
                 if self.check_collisions():
                     self.state = GAME_OVER
+                    self.metrics.record_session()
                     if not self.score_saved:
-                        self.save_ranking(self.user_id, self.score)
+                        clip = self.save_highlight()
+                        self.save_ranking(self.user_id, self.score, clip)
                         self.rankings = self.load_rankings()
                         self.score_saved = True
                     self.player.cleanup()
                     cv2.destroyAllWindows()
             
+            if self.recorder.failed:
+                self.discard_failed_clips()
+            
+            if self.state != self.drawn_state:
+                self.drawn_state = self.state
+                self.idle_base = None
+                self.play_rects = None
+            
+            dirty = None
             if self.state == LOBBY:
-                self.draw_lobby()
+                dirty = self.draw_lobby()
             elif self.state == PLAYING:
-                self.draw_game()
+                start = time.perf_counter()
+                dirty = self.draw_game()
+                render_ms += (time.perf_counter() - start) * 1000
+                self.recorder.capture(self.screen, self.camera_frame)
             elif self.state == GAME_OVER:
-                self.draw_gameover()
+                dirty = self.draw_gameover()
             
-            pygame.display.flip()
-            self.clock.tick(60)
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+            
+            if self.state == PLAYING:
+                self.clock.tick(TARGET_FPS)
+                self.governor.record(render_ms)
+                if self.ticked_state == PLAYING:
+                    self.metrics.record_frame(self.clock.get_time(), self.clock.get_rawtime())
+            elif self.idle_animating:
+                self.clock.tick(IDLE_ANIMATION_FPS)
+            else:
+                self.clock.tick(IDLE_FPS)
+            self.ticked_state = self.state
             
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 break
         
         self.player.cleanup()
         cv2.destroyAllWindows()
+        self.recorder.wait()
+        if self.recorder.failed:
+            self.discard_failed_clips()
+        self.metrics_exporter.stop()
         pygame.quit()
 
 def main():
     parser = argparse.ArgumentParser(description='Chin-up Flappy Bird Game')
     parser.add_argument('--cam', type=int, default=0, help='Camera index (default: 0)')
+    parser.add_argument('--pose-backend', default=POSE_BACKEND, choices=list(POSE_BACKENDS),
+                        help=f'Pose backend (default: {POSE_BACKEND})')
+    parser.add_argument('--pose-model', default=None,
+                        help=f'Model file for the opencv-dnn backend (default: {POSE_MODEL_PATH})')
+    parser.add_argument('--metrics-port', type=int, default=METRICS_PORT,
+                        help=f'Port for the Prometheus /metrics endpoint, 0 to disable (default: {METRICS_PORT})')
+    parser.add_argument('--metrics-file', default=METRICS_FILE,
+                        help='Write metrics in Prometheus text format to this file periodically')
     args = parser.parse_args()
     
-    game = Game(camera_index=args.cam)
+    game = Game(
+        camera_index=args.cam, 
+        pose_backend=args.pose_backend, 
+        pose_model=args.pose_model, 
+        metrics_port=args.metrics_port, 
+        metrics_file=args.metrics_file
+    )
     game.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+import os
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config import *
+
+class Metrics:
+    def __init__(self, window=METRICS_WINDOW):
+        self.frame_intervals = deque(maxlen=window)
+        self.frame_times = deque(maxlen=window)
+        self.frame_time_sum = 0
+        self.frame_count = 0
+
+        self.pose_latencies = deque(maxlen=window)
+        self.pose_latency_sum = 0
+        self.pose_frames = 0
+        self.pose_lost = 0
+        self.camera_read_failures = 0
+
+        self.sessions = 0
+        self.ranking_save_seconds = 0
+        self.ranking_save_sum = 0
+        self.ranking_saves = 0
+
+    def record_frame(self, interval_ms, frame_ms):
+        self.frame_intervals.append(interval_ms)
+        self.frame_times.append(frame_ms)
+        self.frame_time_sum += frame_ms
+        self.frame_count += 1
+
+    def record_pose(self, latency_ms, detected):
+        self.pose_latencies.append(latency_ms)
+        self.pose_latency_sum += latency_ms
+        self.pose_frames += 1
+        if not detected:
+            self.pose_lost += 1
+
+    def record_camera_failure(self):
+        self.camera_read_failures += 1
+
+    def record_session(self):
+        self.sessions += 1
+
+    def record_ranking_save(self, seconds):
+        self.ranking_save_seconds = seconds
+        self.ranking_save_sum += seconds
+        self.ranking_saves += 1
+
+    def summary(self, name, help_text, values, total, count):
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} summary"]
+        values = sorted(values)
+        for quantile in (0.5, 0.9, 0.99):
+            value = values[min(len(values) - 1, int(len(values) * quantile))] if values else 0
+            lines.append(f'{name}{{quantile="{quantile}"}} {value:.3f}')
+        lines.append(f"{name}_sum {total:.3f}")
+        lines.append(f"{name}_count {count}")
+        return lines
+
+    def metric(self, name, kind, help_text, value):
+        return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+
+    def render(self):
+        intervals = list(self.frame_intervals)
+        elapsed = sum(intervals)
+        fps = 1000 * len(intervals) / elapsed if elapsed else 0
+        lost_ratio = self.pose_lost / self.pose_frames if self.pose_frames else 0
+
+        lines = []
+        lines += self.metric("chinning_render_fps", "gauge", "Rendered frames per second over the recent window of gameplay.",
+                             f"{fps:.2f}")
+        lines += self.summary("chinning_frame_time_ms", "Gameplay work time per frame excluding the frame limiter sleep.",
+                              list(self.frame_times), self.frame_time_sum, self.frame_count)
+        lines += self.summary("chinning_pose_inference_ms", "Pose backend inference latency.",
+                              list(self.pose_latencies), self.pose_latency_sum, self.pose_frames)
+        lines += self.metric("chinning_pose_frames_total", "counter", "Camera frames run through pose inference.",
+                             self.pose_frames)
+        lines += self.metric("chinning_pose_lost_total", "counter", "Camera frames without a detected pose.",
+                             self.pose_lost)
+        lines += self.metric("chinning_pose_lost_ratio", "gauge", "Share of camera frames without a detected pose.",
+                             f"{lost_ratio:.4f}")
+        lines += self.metric("chinning_camera_read_failures_total", "counter", "Failed camera frame reads.",
+                             self.camera_read_failures)
+        lines += self.metric("chinning_sessions_total", "counter", "Finished game sessions.", self.sessions)
+        lines += self.metric("chinning_ranking_save_seconds", "gauge", "Duration of the last ranking save.",
+                             f"{self.ranking_save_seconds:.6f}")
+        lines += self.metric("chinning_ranking_save_seconds_total", "counter", "Total time spent saving rankings.",
+                             f"{self.ranking_save_sum:.6f}")
+        lines += self.metric("chinning_ranking_saves_total", "counter", "Ranking saves.", self.ranking_saves)
+        return "\n".join(lines) + "\n"
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+
+        body = self.server.metrics.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class MetricsExporter:
+    def __init__(self, metrics, port=METRICS_PORT, path=METRICS_FILE, host=METRICS_HOST,
+                 interval=METRICS_INTERVAL):
+        self.metrics = metrics
+        self.server = None
+        self.path = path
+        self.interval = interval
+        self.stopped = threading.Event()
+
+        if port:
+            try:
+                self.server = ThreadingHTTPServer((host, port), MetricsHandler)
+                self.server.daemon_threads = True
+                self.server.metrics = metrics
+                threading.Thread(target=self.server.serve_forever, daemon=True).start()
+            except OSError as e:
+                print(f"Failed to start metrics server on {host}:{port}: {e}")
+                self.server = None
+
+        if path:
+            threading.Thread(target=self.write_loop, daemon=True).start()
+
+    def write_file(self):
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                f.write(self.metrics.render())
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Failed to write metrics file: {e}")
+
+    def write_loop(self):
+        while not self.stopped.wait(self.interval):
+            self.write_file()
+
+    def stop(self):
+        self.stopped.set()
+        if self.path:
+            self.write_file()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
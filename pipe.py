@@ -3,8 +3,9 @@ import random
 from config import *
 
 class Pipe:
-    def __init__(self, x):
+    def __init__(self, x, body=None):
         self.x = x
+        self.body = body
         self.height = random.randint(100, GAME_HEIGHT - PIPE_GAP - 100)
         self.width = PIPE_WIDTH
         self.passed = False
@@ -22,35 +23,35 @@ class Pipe:
         self.top_rect.x = self.x
         self.bottom_rect.x = self.x
     
-    def draw(self, screen):
-        shadow_offset = 5
-        shadow_top = pygame.Rect(self.x + shadow_offset, shadow_offset, self.width, self.height)
-        shadow_bottom = pygame.Rect(
-            self.x + shadow_offset, 
-            self.height + PIPE_GAP + shadow_offset, 
-            self.width, 
-            GAME_HEIGHT - (self.height + PIPE_GAP)
-        )
-        pygame.draw.rect(screen, DARK_GRAY, shadow_top)
-        pygame.draw.rect(screen, DARK_GRAY, shadow_bottom)
+    def draw(self, screen, detail=True):
+        if detail:
+            shadow_offset = 5
+            shadow_top = pygame.Rect(self.x + shadow_offset, shadow_offset, self.width, self.height)
+            shadow_bottom = pygame.Rect(
+                self.x + shadow_offset, 
+                self.height + PIPE_GAP + shadow_offset, 
+                self.width, 
+                GAME_HEIGHT - (self.height + PIPE_GAP)
+            )
+            pygame.draw.rect(screen, DARK_GRAY, shadow_top)
+            pygame.draw.rect(screen, DARK_GRAY, shadow_bottom)
         
-        for i in range(self.width):
-            color_ratio = i / self.width
-            r = int(PIPE_GREEN[0] * (1 - color_ratio) + PIPE_HIGHLIGHT[0] * color_ratio)
-            g = int(PIPE_GREEN[1] * (1 - color_ratio) + PIPE_HIGHLIGHT[1] * color_ratio)
-            b = int(PIPE_GREEN[2] * (1 - color_ratio) + PIPE_HIGHLIGHT[2] * color_ratio)
-            pygame.draw.line(screen, (r, g, b), 
-                           (self.x + i, 0), 
-                           (self.x + i, self.height))
-        
-        for i in range(self.width):
-            color_ratio = i / self.width
-            r = int(PIPE_GREEN[0] * (1 - color_ratio) + PIPE_HIGHLIGHT[0] * color_ratio)
-            g = int(PIPE_GREEN[1] * (1 - color_ratio) + PIPE_HIGHLIGHT[1] * color_ratio)
-            b = int(PIPE_GREEN[2] * (1 - color_ratio) + PIPE_HIGHLIGHT[2] * color_ratio)
-            pygame.draw.line(screen, (r, g, b), 
-                           (self.x + i, self.height + PIPE_GAP), 
-                           (self.x + i, GAME_HEIGHT))
+        if self.body is not None:
+            screen.blit(self.body, (self.x, 0), (0, 0, self.width, self.height))
+            screen.blit(self.body, (self.x, self.height + PIPE_GAP), 
+                        (0, 0, self.width, GAME_HEIGHT - (self.height + PIPE_GAP)))
+        else:
+            for i in range(self.width):
+                color_ratio = i / self.width
+                r = int(PIPE_GREEN[0] * (1 - color_ratio) + PIPE_HIGHLIGHT[0] * color_ratio)
+                g = int(PIPE_GREEN[1] * (1 - color_ratio) + PIPE_HIGHLIGHT[1] * color_ratio)
+                b = int(PIPE_GREEN[2] * (1 - color_ratio) + PIPE_HIGHLIGHT[2] * color_ratio)
+                pygame.draw.line(screen, (r, g, b), 
+                               (self.x + i, 0), 
+                               (self.x + i, self.height))
+                pygame.draw.line(screen, (r, g, b), 
+                               (self.x + i, self.height + PIPE_GAP), 
+                               (self.x + i, GAME_HEIGHT))
         
         pygame.draw.rect(screen, PIPE_DARK, self.top_rect, 4)
         pygame.draw.rect(screen, PIPE_DARK, self.bottom_rect, 4)
@@ -82,6 +83,10 @@ class Pipe:
         pygame.draw.line(screen, PIPE_DARK, (bottom_cap.right-1, bottom_cap.top), (bottom_cap.right-1, bottom_cap.bottom), 3)
         pygame.draw.line(screen, PIPE_DARK, (bottom_cap.left, bottom_cap.bottom-1), (bottom_cap.right, bottom_cap.bottom-1), 3)
         
+        bounds = pygame.Rect(int(self.x) - 12, 0, self.width + 25, GAME_HEIGHT)
+        if not detail:
+            return bounds
+        
         rivet_positions = [
             (self.x + self.width//4, self.height - cap_height//2),
             (self.x + 3*self.width//4, self.height - cap_height//2),
@@ -93,6 +98,8 @@ class Pipe:
             pygame.draw.circle(screen, PIPE_DARK, pos, 4)
             pygame.draw.circle(screen, GRAY, pos, 3)
             pygame.draw.circle(screen, WHITE, (pos[0]-1, pos[1]-1), 2)
+        
+        return bounds
     
     def check_collision(self, player_rect):
         return (self.top_rect.colliderect(player_rect) or 
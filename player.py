@@ -1,49 +1,44 @@
 import pygame
 import cv2
-import mediapipe as mp
+import time
 import numpy as np
 from config import *
+from pose_backend import create_pose_backend
+from camera import open_camera
 
 class Player:
-    def __init__(self, x, y):
+    def __init__(self, x, y, pose_backend=None, image=None, metrics=None):
         self.x = x
         self.y = y
         self.velocity = 0
         self.rect = pygame.Rect(x, y, PLAYER_SIZE, PLAYER_SIZE)
         
-        try:
-            original_bird = pygame.image.load(BIRD_IMAGE)
-            self.image = pygame.transform.scale(original_bird, (PLAYER_SIZE, PLAYER_SIZE))
-        except:
+        if image is not None:
+            self.image = image
+        else:
             self.image = pygame.Surface((PLAYER_SIZE, PLAYER_SIZE))
             self.image.fill(YELLOW)
+        self.rotated_images = {}
         
-        self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=False,
-            model_complexity=1,
-            smooth_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        self.mp_draw = mp.solutions.drawing_utils
+        self.pose_backend = pose_backend or create_pose_backend()
+        self.metrics = metrics
         
         self.cap = None
+        self.capture_mode = None
         self.camera_active = False
         
         self.shoulder_center_y = GAME_HEIGHT // 2
         self.pose_detected = False
+        self.pose_result = None
         
     def init_camera(self, camera_index=0):
-        try:
-            self.cap = cv2.VideoCapture(camera_index)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
-            self.camera_active = True
-            return True
-        except:
+        self.cap, capture_mode = open_camera(camera_index, self.capture_mode)
+        self.camera_active = self.cap is not None
+        if self.camera_active:
+            self.capture_mode = capture_mode
+        if not self.camera_active:
             print(f"Failed to initialize camera {camera_index}")
-            return False
+        return self.camera_active
     
     def update_pose(self):
         if not self.camera_active or self.cap is None:
@@ -51,21 +46,21 @@ class Player:
             
         ret, frame = self.cap.read()
         if not ret:
+            if self.metrics:
+                self.metrics.record_camera_failure()
             return None
             
         frame = cv2.flip(frame, 1)
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
-        results = self.pose.process(rgb_frame)
+        start = time.perf_counter()
+        result = self.pose_backend.process(rgb_frame)
+        if self.metrics:
+            self.metrics.record_pose((time.perf_counter() - start) * 1000, result is not None)
         
-        if results.pose_landmarks:
-            landmarks = results.pose_landmarks.landmark
-            
-            left_shoulder = landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
-            right_shoulder = landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]
-            
-            shoulder_center_x = (left_shoulder.x + right_shoulder.x) / 2
-            shoulder_center_y = (left_shoulder.y + right_shoulder.y) / 2
+        self.pose_result = result
+        if result:
+            shoulder_center_y = (result.left_shoulder[1] + result.right_shoulder[1]) / 2
             
             screen_y = int(shoulder_center_y * GAME_HEIGHT)
             
@@ -74,18 +69,23 @@ class Player:
             else:
                 self.shoulder_center_y = screen_y
                 self.pose_detected = True
-            
-            self.mp_draw.draw_landmarks(
-                frame, results.pose_landmarks, self.mp_pose.POSE_CONNECTIONS)
-            
-            center_x = int(shoulder_center_x * CAMERA_WIDTH)
-            center_y = int(shoulder_center_y * CAMERA_HEIGHT)
-            cv2.circle(frame, (center_x, center_y), 10, (0, 255, 0), -1)
         else:
             self.pose_detected = False
             
         return frame
     
+    def draw_pose(self, frame, draw_landmarks=True):
+        result = self.pose_result
+        if result is None:
+            return
+        
+        if draw_landmarks:
+            self.pose_backend.draw(frame, result)
+        
+        center_x = int((result.left_shoulder[0] + result.right_shoulder[0]) / 2 * CAMERA_WIDTH)
+        center_y = int((result.left_shoulder[1] + result.right_shoulder[1]) / 2 * CAMERA_HEIGHT)
+        cv2.circle(frame, (center_x, center_y), 10, (0, 255, 0), -1)
+    
     def update(self):
         if self.pose_detected:
             target_y = self.shoulder_center_y
@@ -110,12 +110,14 @@ class Player:
     def draw(self, screen):
         shadow_offset = 3
         shadow_rect = pygame.Rect(self.x + shadow_offset, int(self.y) + shadow_offset, PLAYER_SIZE, PLAYER_SIZE)
-        pygame.draw.ellipse(screen, (50, 50, 50, 100), shadow_rect)
+        rect = pygame.draw.ellipse(screen, (50, 50, 50, 100), shadow_rect)
         
-        angle = max(-30, min(30, self.velocity * 3))
-        rotated_image = pygame.transform.rotate(self.image, angle)
+        angle = round(max(-30, min(30, self.velocity * 3)))
+        if angle not in self.rotated_images:
+            self.rotated_images[angle] = pygame.transform.rotate(self.image, angle)
+        rotated_image = self.rotated_images[angle]
         rotated_rect = rotated_image.get_rect(center=(self.x + PLAYER_SIZE//2, int(self.y) + PLAYER_SIZE//2))
-        screen.blit(rotated_image, rotated_rect)
+        rect.union_ip(screen.blit(rotated_image, rotated_rect))
         
         if hasattr(self, 'flap_animation'):
             self.flap_animation += 1
@@ -123,18 +125,17 @@ class Player:
             self.flap_animation = 0
             
         if self.flap_animation % 20 < 10:
-            wing_color = (255, 255, 255, 150)
             wing_points = [
                 (self.x - 10, int(self.y) + PLAYER_SIZE//2),
                 (self.x - 5, int(self.y) + PLAYER_SIZE//2 - 8),
                 (self.x + 5, int(self.y) + PLAYER_SIZE//2 - 5),
                 (self.x, int(self.y) + PLAYER_SIZE//2 + 5)
             ]
-            pygame.draw.polygon(screen, WHITE, wing_points)
+            rect.union_ip(pygame.draw.polygon(screen, WHITE, wing_points))
         
         indicator_x, indicator_y = 50, 50
         
-        pygame.draw.circle(screen, WHITE, (indicator_x, indicator_y), 20)
+        indicator_rect = pygame.draw.circle(screen, WHITE, (indicator_x, indicator_y), 20)
         pygame.draw.circle(screen, BLACK, (indicator_x, indicator_y), 20, 3)
         
         if self.pose_detected:
@@ -150,6 +151,10 @@ class Player:
             pygame.draw.line(screen, WHITE, (indicator_x - 6, indicator_y - 6), (indicator_x + 6, indicator_y + 6), 3)
             pygame.draw.line(screen, WHITE, (indicator_x + 6, indicator_y - 6), (indicator_x - 6, indicator_y + 6), 3)
         
+        return [rect, indicator_rect]
+        
     def cleanup(self):
         if self.cap:
             self.cap.release()
+        self.cap = None
+        self.camera_active = False
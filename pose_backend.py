@@ -0,0 +1,109 @@
+import cv2
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from config import *
+
+PoseResult = namedtuple('PoseResult', ['left_shoulder', 'right_shoulder', 'confidence', 'landmarks'])
+
+class PoseBackend(ABC):
+    name = "base"
+
+    @abstractmethod
+    def process(self, rgb_frame):
+        pass
+
+    def draw(self, frame, result):
+        for x, y in (result.left_shoulder, result.right_shoulder):
+            cv2.circle(frame, (int(x * frame.shape[1]), int(y * frame.shape[0])), 6, (255, 0, 0), -1)
+
+    def close(self):
+        pass
+
+class MediaPipePoseBackend(PoseBackend):
+    name = "mediapipe"
+
+    def __init__(self, model_complexity=1):
+        import mediapipe as mp
+
+        self.mp_pose = mp.solutions.pose
+        self.pose = self.mp_pose.Pose(
+            static_image_mode=False,
+            model_complexity=model_complexity,
+            smooth_landmarks=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        self.mp_draw = mp.solutions.drawing_utils
+
+    def process(self, rgb_frame):
+        results = self.pose.process(rgb_frame)
+        if not results.pose_landmarks:
+            return None
+
+        landmarks = results.pose_landmarks.landmark
+        left_shoulder = landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
+        right_shoulder = landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]
+
+        return PoseResult(
+            (left_shoulder.x, left_shoulder.y),
+            (right_shoulder.x, right_shoulder.y),
+            min(left_shoulder.visibility, right_shoulder.visibility),
+            results.pose_landmarks
+        )
+
+    def draw(self, frame, result):
+        self.mp_draw.draw_landmarks(frame, result.landmarks, self.mp_pose.POSE_CONNECTIONS)
+
+    def close(self):
+        self.pose.close()
+
+class OpenCVDnnPoseBackend(PoseBackend):
+    name = "opencv-dnn"
+
+    def __init__(self, model_path=POSE_MODEL_PATH, input_size=POSE_DNN_INPUT_SIZE,
+                 shoulder_channels=POSE_DNN_SHOULDER_CHANNELS, threshold=POSE_DNN_THRESHOLD,
+                 channel_order=POSE_DNN_CHANNEL_ORDER, scale=POSE_DNN_SCALE, mean=POSE_DNN_MEAN):
+        self.net = cv2.dnn.readNet(model_path)
+        self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+        self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+        self.input_size = input_size
+        self.shoulder_channels = shoulder_channels
+        self.threshold = threshold
+        self.swap_rb = channel_order.upper() == "BGR"
+        self.scale = scale
+        self.mean = mean
+
+    def find_peak(self, heatmap):
+        _, confidence, _, point = cv2.minMaxLoc(heatmap)
+        height, width = heatmap.shape
+        return (point[0] + 0.5) / width, (point[1] + 0.5) / height, confidence
+
+    def process(self, rgb_frame):
+        blob = cv2.dnn.blobFromImage(
+            rgb_frame, self.scale, self.input_size, self.mean, swapRB=self.swap_rb, crop=False)
+        self.net.setInput(blob)
+        heatmaps = self.net.forward()[0]
+
+        left_channel, right_channel = self.shoulder_channels
+        left_x, left_y, left_confidence = self.find_peak(heatmaps[left_channel])
+        right_x, right_y, right_confidence = self.find_peak(heatmaps[right_channel])
+
+        confidence = min(left_confidence, right_confidence)
+        if confidence < self.threshold:
+            return None
+
+        return PoseResult((left_x, left_y), (right_x, right_y), confidence, None)
+
+POSE_BACKENDS = {
+    'mediapipe': lambda model_path: MediaPipePoseBackend(model_complexity=1),
+    'mediapipe-lite': lambda model_path: MediaPipePoseBackend(model_complexity=0),
+    'mediapipe-heavy': lambda model_path: MediaPipePoseBackend(model_complexity=2),
+    'opencv-dnn': lambda model_path: OpenCVDnnPoseBackend(model_path or POSE_MODEL_PATH),
+}
+
+def create_pose_backend(name=POSE_BACKEND, model_path=None):
+    if name not in POSE_BACKENDS:
+        raise ValueError(f"Unknown pose backend: {name} (choose from {', '.join(POSE_BACKENDS)})")
+    backend = POSE_BACKENDS[name](model_path)
+    backend.name = name
+    return backend
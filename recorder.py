@@ -0,0 +1,93 @@
+import pygame
+import cv2
+import numpy as np
+import os
+import threading
+from collections import deque
+from config import *
+
+class SessionRecorder:
+    def __init__(self, seconds=RECORD_SECONDS, fps=RECORD_FPS):
+        self.fps = fps
+        self.interval = 1000 / fps
+        self.frames = deque(maxlen=int(seconds * fps))
+        self.last_capture_time = -self.interval
+
+        self.game_size = (int(GAME_WIDTH * RECORD_SCALE), int(GAME_HEIGHT * RECORD_SCALE))
+        self.camera_size = (
+            int(CAMERA_WIDTH * self.game_size[1] / CAMERA_HEIGHT),
+            self.game_size[1]
+        )
+
+        self.workers = []
+        self.failed = deque()
+
+    def capture(self, screen, camera_frame):
+        current_time = pygame.time.get_ticks()
+        if current_time - self.last_capture_time < self.interval:
+            return
+        self.last_capture_time = current_time
+
+        game_surface = pygame.transform.scale(screen, self.game_size)
+        game_bytes = pygame.image.tostring(game_surface, 'RGB')
+
+        if camera_frame is not None:
+            camera_frame = cv2.resize(camera_frame, self.camera_size, interpolation=cv2.INTER_NEAREST)
+
+        self.frames.append((game_bytes, camera_frame))
+
+    def clear(self):
+        self.frames.clear()
+        self.last_capture_time = -self.interval
+
+    def save(self, path):
+        if not self.frames:
+            return None
+
+        frames = list(self.frames)
+        self.clear()
+
+        worker = threading.Thread(target=self.encode, args=(path, frames), daemon=True)
+        worker.start()
+        self.workers = [w for w in self.workers if w.is_alive()] + [worker]
+        return path
+
+    def encode(self, path, frames):
+        try:
+            self.write_clip(path, frames)
+            return True
+        except Exception as e:
+            print(f"Failed to save highlight clip {path}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.failed.append(path)
+            return False
+
+    def write_clip(self, path, frames):
+        width = self.game_size[0] + self.camera_size[0]
+        height = self.game_size[1]
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fourcc = cv2.VideoWriter_fourcc(*RECORD_FOURCC)
+        writer = cv2.VideoWriter(path, fourcc, self.fps, (width, height))
+        if not writer.isOpened():
+            raise OSError("could not open video writer")
+
+        blank_camera = np.zeros((self.camera_size[1], self.camera_size[0], 3), dtype=np.uint8)
+
+        try:
+            for game_bytes, camera_frame in frames:
+                game_frame = np.frombuffer(game_bytes, dtype=np.uint8).reshape(height, self.game_size[0], 3)
+                game_frame = cv2.cvtColor(game_frame, cv2.COLOR_RGB2BGR)
+                if camera_frame is None:
+                    camera_frame = blank_camera
+                writer.write(np.hstack((game_frame, camera_frame)))
+        finally:
+            writer.release()
+
+    def wait(self):
+        for worker in self.workers:
+            worker.join()
+        self.workers = []
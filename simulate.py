@@ -0,0 +1,249 @@
+import numpy as np
+import argparse
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from config import *
+
+FRAME_MS = 1000 / TARGET_FPS
+
+REACH_SPEED = (2, 8)
+REACH_TOP = (0.05, 0.3)
+REACH_BOTTOM = (0.7, 0.95)
+LOOKAHEAD = (200, 700)
+FATIGUE_SECONDS = (30, 180)
+POSE_NOISE = (5, 25)
+POSE_DROP = (0.0, 0.01)
+POSE_RECOVER = 0.1
+
+def load_profile(path):
+    if path.endswith('.npy'):
+        profile = np.load(path)
+    else:
+        profile = np.genfromtxt(path, delimiter=',', dtype=float)
+    return np.asarray(profile, dtype=float).ravel()
+
+class BatchSimulator:
+    def __init__(self, games, pipe_gap=PIPE_GAP, speed_increase=SPEED_INCREASE,
+                 spawn_time=PIPE_SPAWN_TIME, gravity=GRAVITY, profile=None, seed=None):
+        self.games = games
+        self.pipe_gap = pipe_gap
+        self.speed_increase = speed_increase
+        self.spawn_time = spawn_time
+        self.gravity = gravity
+        self.profile = profile
+        self.rng = np.random.default_rng(seed)
+
+        pipe_life = (GAME_WIDTH + PIPE_WIDTH) / PIPE_SPEED
+        self.slots = math.ceil(pipe_life * FRAME_MS / spawn_time) + 1
+
+        self.y = np.full(games, GAME_HEIGHT // 2, dtype=float)
+        self.velocity = np.zeros(games)
+        self.shoulder_y = np.full(games, GAME_HEIGHT // 2, dtype=float)
+        self.pose_detected = np.zeros(games, dtype=bool)
+
+        self.speed = np.full(games, PIPE_SPEED, dtype=float)
+        self.score = np.zeros(games, dtype=int)
+        self.alive = np.ones(games, dtype=bool)
+        self.frames = np.zeros(games, dtype=int)
+
+        self.pipe_x = np.zeros((games, self.slots))
+        self.pipe_height = np.zeros((games, self.slots), dtype=int)
+        self.pipe_active = np.zeros((games, self.slots), dtype=bool)
+        self.pipe_passed = np.zeros((games, self.slots), dtype=bool)
+        self.spawn_count = 0
+        self.last_pipe_time = 0
+
+        if profile is None:
+            self.body_y = self.y.copy()
+            self.reach_speed = self.rng.uniform(*REACH_SPEED, games)
+            self.reach_top = self.rng.uniform(*REACH_TOP, games) * GAME_HEIGHT
+            self.reach_bottom = self.rng.uniform(*REACH_BOTTOM, games) * GAME_HEIGHT
+            self.lookahead = self.rng.uniform(*LOOKAHEAD, games)
+            self.fatigue_frames = self.rng.uniform(*FATIGUE_SECONDS, games) * TARGET_FPS
+            self.pose_noise = self.rng.uniform(*POSE_NOISE, games)
+            self.pose_drop = self.rng.uniform(*POSE_DROP, games)
+            self.pose_lost = np.zeros(games, dtype=bool)
+        else:
+            self.profile_offset = self.rng.integers(0, len(profile), games)
+
+    def next_gap_target(self):
+        ahead = (self.pipe_active & (self.pipe_x + PIPE_WIDTH >= PLAYER_X) &
+                 (self.pipe_x < PLAYER_X + self.lookahead[:, None]))
+        candidates = np.where(ahead, self.pipe_x, np.inf)
+        nearest = candidates.argmin(axis=1)
+        gap_top = self.pipe_height[np.arange(self.games), nearest]
+        target = gap_top + self.pipe_gap / 2 - PLAYER_SIZE / 2
+        return np.where(ahead.any(axis=1), target, GAME_HEIGHT / 2 - PLAYER_SIZE / 2)
+
+    def read_pose(self, frame):
+        if self.profile is not None:
+            values = self.profile[(self.profile_offset + frame) % len(self.profile)]
+            detected = ~np.isnan(values)
+            return np.nan_to_num(values) * GAME_HEIGHT, detected
+
+        reach = self.reach_speed * np.maximum(0.2, 1 - frame / self.fatigue_frames)
+        step = np.clip(self.next_gap_target() - self.body_y, -reach, reach)
+        self.body_y = np.clip(self.body_y + step, self.reach_top, self.reach_bottom)
+        screen_y = self.body_y + self.rng.normal(0, 1, self.games) * self.pose_noise
+
+        chance = self.rng.random(self.games)
+        self.pose_lost = np.where(self.pose_lost, chance >= POSE_RECOVER, chance < self.pose_drop)
+        return screen_y, ~self.pose_lost
+
+    def update_pose(self, frame):
+        screen_y, detected = self.read_pose(frame)
+        screen_y = np.trunc(screen_y)
+
+        self.shoulder_y = np.where(
+            detected & self.pose_detected,
+            self.shoulder_y * 0.8 + screen_y * 0.2,
+            np.where(detected, screen_y, self.shoulder_y)
+        )
+        self.pose_detected = detected
+
+    def update_player(self):
+        falling = ~self.pose_detected
+        self.velocity = np.where(falling, self.velocity + self.gravity, self.velocity)
+        self.y = np.where(falling, self.y + self.velocity, self.y * 0.9 + self.shoulder_y * 0.1)
+
+        bottom = GAME_HEIGHT - PLAYER_SIZE
+        clamped = (self.y < 0) | (self.y > bottom)
+        self.velocity = np.where(clamped, 0, self.velocity)
+        self.y = np.clip(self.y, 0, bottom)
+
+    def spawn_pipe(self, current_time):
+        if current_time - self.last_pipe_time <= self.spawn_time:
+            return
+        self.last_pipe_time = current_time
+
+        slot = self.spawn_count % self.slots
+        self.spawn_count += 1
+        self.pipe_x[:, slot] = GAME_WIDTH
+        self.pipe_height[:, slot] = self.rng.integers(100, GAME_HEIGHT - self.pipe_gap - 100 + 1, self.games)
+        self.pipe_active[:, slot] = True
+        self.pipe_passed[:, slot] = False
+
+    def update_pipes(self):
+        self.pipe_x -= np.where(self.pipe_active, self.speed[:, None], 0)
+
+        passed = self.pipe_active & ~self.pipe_passed & (self.pipe_x + PIPE_WIDTH < PLAYER_X)
+        self.pipe_passed |= passed
+        count = passed.sum(axis=1) * self.alive
+        self.score += count
+        self.speed += count * self.speed_increase
+
+        self.pipe_active &= ~(self.pipe_x + PIPE_WIDTH < 0)
+
+    def check_collisions(self):
+        rect_y = np.trunc(self.y)[:, None]
+        rect_x = np.where(self.pipe_x >= 0, np.floor(self.pipe_x + 0.5), np.ceil(self.pipe_x - 0.5))
+        overlap_x = (rect_x < PLAYER_X + PLAYER_SIZE) & (rect_x + PIPE_WIDTH > PLAYER_X)
+        hit_top = rect_y < self.pipe_height
+        hit_bottom = rect_y + PLAYER_SIZE > self.pipe_height + self.pipe_gap
+        hit_pipe = (self.pipe_active & overlap_x & (hit_top | hit_bottom)).any(axis=1)
+
+        return (self.y <= 0) | (self.y >= GAME_HEIGHT - PLAYER_SIZE) | hit_pipe
+
+    def compact(self):
+        keep = self.alive
+        for name, value in list(vars(self).items()):
+            if isinstance(value, np.ndarray) and len(value) == self.games and name != 'profile':
+                setattr(self, name, value[keep])
+        self.games = int(keep.sum())
+
+    def run(self, max_frames):
+        scores = np.zeros(self.games, dtype=int)
+        frames = np.zeros(self.games, dtype=int)
+        self.index = np.arange(self.games)
+
+        for frame in range(1, max_frames + 1):
+            self.update_pose(frame)
+            self.update_player()
+            self.spawn_pipe(frame * FRAME_MS)
+            self.update_pipes()
+
+            self.alive &= ~self.check_collisions()
+            self.frames += self.alive
+
+            if frame % TARGET_FPS == 0 or frame == max_frames:
+                finished = ~self.alive
+                scores[self.index[finished]] = self.score[finished]
+                frames[self.index[finished]] = self.frames[finished]
+                if self.alive.all():
+                    continue
+                if not self.alive.any():
+                    break
+                self.compact()
+
+        scores[self.index] = self.score
+        frames[self.index] = self.frames
+        return scores, frames
+
+def simulate_chunk(params, games, seed, max_frames, profile):
+    simulator = BatchSimulator(games, profile=profile, seed=seed, **params)
+    return simulator.run(max_frames)
+
+def simulate(param_sets, games, max_frames, workers=1, chunk=5000, profile=None, seed=0):
+    tasks = []
+    for index, params in enumerate(param_sets):
+        for start in range(0, games, chunk):
+            tasks.append((index, params, min(chunk, games - start), [seed, index, start]))
+
+    results = [([], []) for _ in param_sets]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (index, executor.submit(simulate_chunk, params, count, task_seed, max_frames, profile))
+                for index, params, count, task_seed in tasks
+            ]
+            outputs = [(index, future.result()) for index, future in futures]
+    else:
+        outputs = [
+            (index, simulate_chunk(params, count, task_seed, max_frames, profile))
+            for index, params, count, task_seed in tasks
+        ]
+
+    for index, (scores, frames) in outputs:
+        results[index][0].append(scores)
+        results[index][1].append(frames)
+
+    return [(np.concatenate(scores), np.concatenate(frames)) for scores, frames in results]
+
+def main():
+    parser = argparse.ArgumentParser(description='Vectorized batch simulator for difficulty tuning')
+    parser.add_argument('--games', type=int, default=10000, help='Games per parameter set (default: 10000)')
+    parser.add_argument('--gap', type=int, nargs='+', default=[PIPE_GAP], help='PIPE_GAP values')
+    parser.add_argument('--speed-increase', type=float, nargs='+', default=[SPEED_INCREASE],
+                        help='SPEED_INCREASE values')
+    parser.add_argument('--spawn-time', type=int, nargs='+', default=[PIPE_SPAWN_TIME],
+                        help='PIPE_SPAWN_TIME values (ms)')
+    parser.add_argument('--gravity', type=float, nargs='+', default=[GRAVITY], help='GRAVITY values')
+    parser.add_argument('--minutes', type=float, default=3, help='Max game length in minutes (default: 3)')
+    parser.add_argument('--profile', default=None,
+                        help='Recorded shoulder profile (.npy or .csv of normalized y, NaN = pose lost)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker processes')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    param_sets = [
+        {'pipe_gap': gap, 'speed_increase': speed_increase, 'spawn_time': spawn_time, 'gravity': gravity}
+        for gap, speed_increase, spawn_time, gravity
+        in itertools.product(args.gap, args.speed_increase, args.spawn_time, args.gravity)
+    ]
+    profile = load_profile(args.profile) if args.profile else None
+    max_frames = int(args.minutes * 60 * TARGET_FPS)
+
+    results = simulate(param_sets, args.games, max_frames, args.workers, profile=profile, seed=args.seed)
+
+    print(f"{'gap':>5}{'inc':>6}{'spawn':>7}{'grav':>6}{'mean':>8}{'median':>8}"
+          f"{'p90':>6}{'max':>6}{'zero':>7}{'alive s':>9}")
+    for params, (scores, frames) in zip(param_sets, results):
+        print(f"{params['pipe_gap']:>5}{params['speed_increase']:>6.2f}{params['spawn_time']:>7}"
+              f"{params['gravity']:>6.2f}{scores.mean():>8.2f}{np.median(scores):>8.1f}"
+              f"{np.percentile(scores, 90):>6.0f}{scores.max():>6}{(scores == 0).mean():>7.1%}"
+              f"{frames.mean() / TARGET_FPS:>9.1f}")
+
+if __name__ == "__main__":
+    main()